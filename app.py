@@ -1,21 +1,42 @@
 import os
+import asyncio
+import base64
 import logging
+import pickle
 import re
 import random
+import threading
 from datetime import datetime, timedelta
-from flask import Flask, jsonify, request
+from flask import Flask, Response, make_response, request
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_cors import CORS
-from flask_restx import Api, Resource, fields
+from flask_restx import Api, Resource, fields, marshal
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import postgresql, sqlite
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import lxml.etree
 from dotenv import load_dotenv
+import orjson
 import time
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Load environment variables
 load_dotenv()
 
@@ -28,6 +49,17 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# orjson serializes responses in C (including datetimes natively), several
+# times faster than the stdlib json encoder
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
 # Database URL configuration with PostgreSQL support
 # Fix for Render/Neon: convert postgres:// to postgresql://
 database_url = os.environ.get('DATABASE_URL', 'sqlite:///jobs.db')
@@ -37,6 +69,9 @@ if database_url and database_url.startswith('postgres://'):
 
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if database_url.startswith('postgresql'):
+    # Size the connection pool for threaded gunicorn workers
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_size': 10, 'max_overflow': 20}
 app.config['CACHE_TIMEOUT'] = int(os.environ.get('CACHE_TIMEOUT', 300))  # 5 minutes default
 
 # Initialize extensions
@@ -59,12 +94,99 @@ api = Api(
     doc='/docs'
 )
 
-# Cache storage (in-memory, can be upgraded to Redis)
+# flask_restx has its own JSON representation that bypasses app.json;
+# point it at orjson too
+@api.representation('application/json')
+def output_json(data, code, headers=None):
+    response = make_response(orjson.dumps(data, option=orjson.OPT_NAIVE_UTC), code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
+
+# Shared cache: Redis when REDIS_URL is set (correct across gunicorn
+# workers), otherwise a per-process in-memory dict keyed by page
+redis_client = None
+if redis is not None and os.environ.get('REDIS_URL'):
+    try:
+        redis_client = redis.Redis.from_url(os.environ['REDIS_URL'])
+        redis_client.ping()
+        logger.info("Using Redis cache")
+    except Exception as e:
+        logger.warning(f"Redis unavailable, falling back to in-memory cache: {e}")
+        redis_client = None
+
+# Freshness bookkeeping uses time.monotonic() floats: no datetime
+# allocation or ISO formatting on the hot path, and immune to clock steps
 cache = {
-    'jobs': None,
-    'timestamp': None
+    'pages': {},
+    'timestamp_monotonic': None
 }
 
+def cache_age_seconds():
+    """Seconds since the last successful scrape, or None before the first"""
+    if cache['timestamp_monotonic'] is None:
+        return None
+    return time.monotonic() - cache['timestamp_monotonic']
+
+def cache_get_jobs(page=1):
+    """Return cached jobs for a page, or None on miss/expiry"""
+    if redis_client:
+        try:
+            blob = redis_client.get(f'hn:jobs:page:{page}')
+            if blob:
+                return pickle.loads(blob)
+            return None
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+    entry = cache['pages'].get(page)
+    if entry:
+        if time.monotonic() - entry['timestamp'] < app.config['CACHE_TIMEOUT']:
+            return entry['jobs']
+    return None
+
+def cache_set_jobs(jobs, page=1):
+    """Cache jobs for a page with the configured TTL"""
+    cache['timestamp_monotonic'] = time.monotonic()
+    if redis_client:
+        try:
+            redis_client.setex(
+                f'hn:jobs:page:{page}',
+                app.config['CACHE_TIMEOUT'],
+                pickle.dumps(jobs)
+            )
+            return
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+    cache['pages'][page] = {'jobs': jobs, 'timestamp': time.monotonic()}
+
+# Memoized /stats payload: the underlying data only changes when a
+# scrape commits, so identical queries within the TTL are wasted work
+_stats_cache = {'payload': None, 'timestamp': None}
+_STATS_CACHE_TTL = 60
+
+# Shared HTTP session with keep-alive connection pooling and retries,
+# so repeated scrapes reuse the same TCP/TLS connection to HN
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504]
+    )
+))
+SESSION.headers.update({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # brotli/zstd shrink the HTML payload ~25-40% vs gzip; urllib3
+    # decodes them transparently with the brotli/zstandard packages
+    'Accept-Encoding': 'br, zstd, gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
 # Database Models
 class Job(db.Model):
     __tablename__ = 'jobs'
@@ -75,22 +197,19 @@ class Job(db.Model):
     url = db.Column(db.String(1000), nullable=False)
     company = db.Column(db.String(200))
     location = db.Column(db.String(200))
+    # Lowercase copies materialized at write time, so searches run plain
+    # LIKE instead of lowering every row per query
+    title_lc = db.Column(db.String(500))
+    company_lc = db.Column(db.String(200))
+    location_lc = db.Column(db.String(200))
     posted_date = db.Column(db.DateTime)
     scraped_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_new = db.Column(db.Boolean, default=True)
-    
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'hn_id': self.hn_id,
-            'title': self.title,
-            'url': self.url,
-            'company': self.company,
-            'location': self.location,
-            'posted_date': self.posted_date.isoformat() if self.posted_date else None,
-            'scraped_at': self.scraped_at.isoformat() if self.scraped_at else None,
-            'is_new': self.is_new
-        }
+
+    # Covers the /jobs hot path: filter on is_new, order by scraped_at
+    __table_args__ = (
+        db.Index('ix_jobs_is_new_scraped_at', 'is_new', 'scraped_at'),
+    )
 
 # API Models for Swagger documentation
 job_model = api.model('Job', {
@@ -100,36 +219,101 @@ job_model = api.model('Job', {
     'url': fields.String(description='Job URL'),
     'company': fields.String(description='Company name'),
     'location': fields.String(description='Job location'),
-    'posted_date': fields.String(description='Posting date'),
-    'scraped_at': fields.String(description='When job was scraped'),
+    'posted_date': fields.DateTime(dt_format='iso8601', description='Posting date'),
+    'scraped_at': fields.DateTime(dt_format='iso8601', description='When job was scraped'),
     'is_new': fields.Boolean(description='Whether job is new')
 })
 
+# Branches of the fused title pattern: the company prefix (delimited by
+# "hiring", " - " or ": "), a known location keyword, and a
+# parenthesized location
+_TITLE_BRANCHES = (
+    r'^(?P<company>.+?)(?:\s+(?:is\s+)?hiring|\s+-\s|:\s)',
+    r'(?P<loc>\b(?:Remote|San Francisco|SF|New York|NYC|London|Berlin|Amsterdam|Toronto|Vancouver|Austin|Seattle|Boston)\b)',
+    r'\((?P<paren>[^)]+)\)',
+)
+
+# Compiled once at import time. The company branch stays separate: it is
+# ^-anchored (a single match attempt, not a scan) and must not consume
+# the title, or a location inside the company prefix -- the common
+# "Company (Location) is hiring" shape -- would be lost. The two
+# location branches fuse into one alternation scanned in a single pass.
+_COMPANY_RE = re.compile(_TITLE_BRANCHES[0], re.IGNORECASE)
+_LOC_KEYWORD_RE = re.compile(_TITLE_BRANCHES[1], re.IGNORECASE)
+_LOCATION_RE = re.compile('|'.join(_TITLE_BRANCHES[1:]), re.IGNORECASE)
+
+# Optional Hyperscan database over the same branches. Hyperscan matches
+# all patterns in one SIMD pass but cannot report capture groups, so it
+# only prefilters: titles with no hit at all skip the Python regex, and
+# everything else goes through the same Python matching -- results are
+# identical with or without the package.
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            # Hyperscan does not understand named groups, so strip the names
+            expressions=[re.sub(r'\(\?P<\w+>', '(', p).encode() for p in _TITLE_BRANCHES],
+            ids=list(range(len(_TITLE_BRANCHES))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_TITLE_BRANCHES)
+        )
+        logger.info("Using Hyperscan to prefilter title field extraction")
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, falling back to re: {e}")
+        _HS_DB = None
+
+def _hs_any_match(title):
+    """True if any title branch hits, per one Hyperscan SIMD scan"""
+    hits = []
+    _HS_DB.scan(
+        title.encode('utf-8', 'ignore'),
+        match_event_handler=lambda pat_id, start, end, flags, ctx: hits.append(pat_id)
+    )
+    return bool(hits)
+
 # Helper Functions
-def extract_company_from_title(title):
-    """Extract company name from job title (e.g., 'Company Name is hiring...')"""
-    patterns = [
-        r'^(.+?)\s+(?:is\s+)?hiring',
-        r'^(.+?)\s+-\s+',
-        r'^(.+?):\s+',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-    return None
+def extract_fields(title):
+    """Extract (company, location) from a job title.
 
-def extract_location_from_title(title):
-    """Extract location from title if mentioned"""
-    location_patterns = [
-        r'\b(Remote|San Francisco|SF|New York|NYC|London|Berlin|Amsterdam|Toronto|Vancouver|Austin|Seattle|Boston)\b',
-        r'\(([^)]+)\)',  # Location in parentheses
-    ]
-    for pattern in location_patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
-            return match.group(1) if match.groups() else match.group(0)
-    return None
+    One anchored match attempt for the company plus one fused scan for
+    the location, so neither field can shadow the other.
+    """
+    if _HS_DB is not None and not _hs_any_match(title):
+        return None, None
+
+    match = _COMPANY_RE.match(title)
+    company = match.group('company').strip() if match else None
+
+    location = None
+    parens = []
+    for match in _LOCATION_RE.finditer(title):
+        # A known location keyword wins over a parenthesized value
+        if match.group('loc'):
+            location = match.group('loc')
+            break
+        parens.append(match.group('paren'))
+    if location is None and parens:
+        # The keyword may sit inside a parenthesized group the scan
+        # consumed whole, e.g. "(Remote, US timezones)"
+        for paren in parens:
+            keyword = _LOC_KEYWORD_RE.search(paren)
+            if keyword:
+                location = keyword.group('loc')
+                break
+        else:
+            location = parens[0]
+    return company, location
+
+def encode_cursor(job):
+    """Encode a keyset pagination cursor from the last row of a page"""
+    raw = f"{job.scraped_at.isoformat()}|{job.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor):
+    """Decode a keyset pagination cursor into (scraped_at, id)"""
+    raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    scraped_at, _, job_id = raw.rpartition('|')
+    return datetime.fromisoformat(scraped_at), int(job_id)
 
 def parse_hn_date(date_str):
     """Parse Hacker News date format"""
@@ -152,136 +336,312 @@ def get_random_user_agent():
     ]
     return random.choice(user_agents)
 
+def build_jobs_url(page=1):
+    """Build the HN jobs URL for a given page"""
+    if page > 1:
+        return f"https://news.ycombinator.com/jobs?p={page}"
+    return "https://news.ycombinator.com/jobs"
+
+def _row_to_job(item, metadata_row):
+    """Build a job dict from an athing row and its metadata sibling"""
+    title_line = item.find('.//span[@class="titleline"]')
+    if title_line is None:
+        return None
+
+    link = title_line.find('a')
+    if link is None:
+        return None
+
+    title = ''.join(link.itertext()).strip()
+    href = link.get('href') or ''
+
+    # Handle relative URLs
+    if href.startswith('item?'):
+        url_full = f"https://news.ycombinator.com/{href}"
+    elif href.startswith('http'):
+        url_full = href
+    else:
+        url_full = f"https://news.ycombinator.com/{href}"
+
+    # Extract HN ID from URL or item
+    hn_id = None
+    if 'id=' in href:
+        hn_id = href.split('id=')[1].split('&')[0]
+    else:
+        # Try to get from data attribute
+        hn_id = item.get('id', None)
+
+    # Extract additional info
+    company, location = extract_fields(title)
+
+    # The metadata row carries the posting age
+    posted_date = None
+    if metadata_row is not None:
+        age_elem = metadata_row.find('.//span[@class="age"]')
+        if age_elem is not None:
+            posted_date = parse_hn_date(age_elem.get('title', ''))
+
+    return {
+        'hn_id': hn_id or f"unknown_{int(time.time())}",
+        'title': title,
+        'url': url_full,
+        'company': company,
+        'location': location,
+        'posted_date': posted_date
+    }
+
+def _drain_parsed_jobs(parser, pending=None):
+    """Collect job dicts for rows the pull parser has completed so far.
+
+    An athing row is processed once the following <tr> (its metadata
+    sibling) has been parsed; processed rows are cleared and detached so
+    memory stays flat while the page streams in. Returns (jobs, pending)
+    where pending is an athing row still waiting for its metadata
+    sibling -- pass it back in on the next call while streaming.
+    """
+    jobs = []
+    for _, elem in parser.read_events():
+        if elem.tag != 'tr':
+            continue
+
+        if 'athing' in (elem.get('class') or ''):
+            pending = elem
+            continue
+
+        if pending is not None:
+            try:
+                job_data = _row_to_job(pending, elem)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                logger.warning(f"Error parsing job item: {e}")
+            pending = None
+
+        # Discard finished rows instead of keeping the whole DOM
+        parent = elem.getparent()
+        if parent is not None:
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    return jobs, pending
+
+def parse_jobs_html(html):
+    """Parse an HN jobs page into a list of job dicts"""
+    parser = lxml.etree.HTMLPullParser(events=('end',))
+    parser.feed(html)
+    parser.close()
+    jobs, _ = _drain_parsed_jobs(parser)
+    return jobs
+
+# Last-seen HTTP validators per page (with the jobs parsed from that
+# response), so unchanged pages can be answered with a 304 and no body
+_conditional = {}
+
+# Single-flight bookkeeping: concurrent cache misses for the same page
+# wait on the first caller's scrape instead of each fetching HN
+_inflight = {}
+_inflight_lock = threading.Lock()
+
 def scrape_jobs(page=1, use_cache=True):
     """Scrape jobs from Hacker News with pagination support"""
+    claimed = False
+
     # Check cache
-    if use_cache and cache['jobs'] and cache['timestamp']:
-        cache_age = datetime.utcnow() - cache['timestamp']
-        if cache_age.total_seconds() < app.config['CACHE_TIMEOUT']:
+    if use_cache:
+        cached = cache_get_jobs(page)
+        if cached is not None:
             logger.info("Returning cached jobs")
-            return cache['jobs']
-    
-    url = f"https://news.ycombinator.com/jobs"
-    if page > 1:
-        url = f"https://news.ycombinator.com/jobs?p={page}"
-    
+            return cached
+
+        # Claim the in-flight slot for this page, or wait on whoever has it
+        with _inflight_lock:
+            event = _inflight.get(page)
+            if event is None:
+                _inflight[page] = threading.Event()
+                claimed = True
+        if not claimed:
+            event.wait(timeout=30)
+            cached = cache_get_jobs(page)
+            if cached is not None:
+                logger.info("Returning jobs scraped by a concurrent request")
+                return cached
+            # The scraping thread failed or timed out; fetch ourselves
+
+    url = build_jobs_url(page)
+
     try:
-        headers = {
-            'User-Agent': get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        # Rotate only the User-Agent per call; the rest of the headers are
+        # set once on the shared session
+        headers = {'User-Agent': get_random_user_agent()}
+
+        # Conditional GET: if we have validators from the last fetch, let
+        # HN answer 304 and skip the body transfer and parse entirely
+        validators = _conditional.get(page)
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        response = SESSION.get(
+            url,
+            headers=headers,
+            timeout=(3.05, 10),
+            stream=True
+        )
+
+        if response.status_code == 304:
+            logger.info(f"Page {page} unchanged upstream (304), reusing previous parse")
+            jobs = validators['jobs']
+            cache_set_jobs(jobs, page)
+            return jobs
+
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+
+        # Stream chunks straight into the pull parser: rows are emitted
+        # (and freed) while the rest of the page is still in flight
+        parser = lxml.etree.HTMLPullParser(events=('end',))
         jobs = []
-        
-        # Find all job rows
-        job_rows = soup.find_all('tr', class_='athing')
-        
-        for item in job_rows:
-            try:
-                title_line = item.find('span', class_='titleline')
-                if not title_line:
-                    continue
-                
-                link = title_line.find('a')
-                if not link:
-                    continue
-                
-                title = link.text.strip()
-                href = link.get('href', '')
-                
-                # Handle relative URLs
-                if href.startswith('item?'):
-                    url_full = f"https://news.ycombinator.com/{href}"
-                elif href.startswith('http'):
-                    url_full = href
-                else:
-                    url_full = f"https://news.ycombinator.com/{href}"
-                
-                # Extract HN ID from URL or item
-                hn_id = None
-                if 'id=' in href:
-                    hn_id = href.split('id=')[1].split('&')[0]
-                else:
-                    # Try to get from data attribute
-                    hn_id = item.get('id', None)
-                
-                # Extract additional info
-                company = extract_company_from_title(title)
-                location = extract_location_from_title(title)
-                
-                # Find the next row which contains metadata
-                metadata_row = item.find_next_sibling('tr')
-                posted_date = None
-                if metadata_row:
-                    age_elem = metadata_row.find('span', class_='age')
-                    if age_elem:
-                        posted_date = parse_hn_date(age_elem.get('title', ''))
-                
-                job_data = {
-                    'hn_id': hn_id or f"unknown_{int(time.time())}",
-                    'title': title,
-                    'url': url_full,
-                    'company': company,
-                    'location': location,
-                    'posted_date': posted_date
-                }
-                
-                jobs.append(job_data)
-                
-            except Exception as e:
-                logger.warning(f"Error parsing job item: {e}")
-                continue
-        
+        pending = None
+        for chunk in response.iter_content(8192):
+            parser.feed(chunk)
+            parsed, pending = _drain_parsed_jobs(parser, pending)
+            jobs.extend(parsed)
+        parser.close()
+        parsed, _ = _drain_parsed_jobs(parser, pending)
+        jobs.extend(parsed)
+
+        # Remember the response validators for the next conditional GET
+        if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+            _conditional[page] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'jobs': jobs
+            }
+
         # Update cache
-        cache['jobs'] = jobs
-        cache['timestamp'] = datetime.utcnow()
-        
+        cache_set_jobs(jobs, page)
+
         logger.info(f"Scraped {len(jobs)} jobs from page {page}")
         return jobs
-        
+
     except requests.RequestException as e:
         logger.error(f"Request error: {e}")
         raise Exception(f"Failed to fetch jobs: {str(e)}")
     except Exception as e:
         logger.error(f"Scraping error: {e}")
         raise Exception(f"Failed to parse jobs: {str(e)}")
+    finally:
+        # Wake any requests waiting on this page, success or not
+        if claimed:
+            with _inflight_lock:
+                event = _inflight.pop(page, None)
+            if event is not None:
+                event.set()
+
+async def _fetch(session, url):
+    """Fetch a single page within the shared aiohttp session"""
+    async with session.get(url, headers={'User-Agent': get_random_user_agent()}) as response:
+        response.raise_for_status()
+        return await response.text()
+
+async def _scrape_pages_async(pages):
+    """Fetch all requested pages concurrently, then parse each synchronously"""
+    connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=30, connect=3.05)
+    # Let aiohttp advertise its own Accept-Encoding: the session header
+    # requests zstd, which aiohttp cannot decode
+    headers = {k: v for k, v in SESSION.headers.items() if k.lower() != 'accept-encoding'}
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=headers
+    ) as session:
+        htmls = await asyncio.gather(*[_fetch(session, build_jobs_url(p)) for p in pages])
+
+    jobs = []
+    for page, html in zip(pages, htmls):
+        page_jobs = parse_jobs_html(html)
+        cache_set_jobs(page_jobs, page)
+        jobs.extend(page_jobs)
+    return jobs
+
+def scrape_pages(pages):
+    """Scrape multiple HN jobs pages concurrently (network-bound fan-out)"""
+    return asyncio.run(_scrape_pages_async(pages))
+
+def _existing_hn_ids(ids):
+    """Fetch the subset of hn_ids already in the database with IN queries.
+
+    Chunked to stay under SQLite's bind-parameter limit on large
+    multi-page batches; each chunk is a single round-trip.
+    """
+    existing = set()
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        existing.update(r[0] for r in db.session.query(Job.hn_id).filter(Job.hn_id.in_(chunk)).all())
+    return existing
 
 def save_jobs_to_db(jobs_data):
-    """Save scraped jobs to database, marking new ones"""
-    new_count = 0
+    """Save scraped jobs to database in one bulk upsert, marking new ones"""
+    if not jobs_data:
+        return 0
+
+    # De-duplicate on hn_id (keeping the first occurrence) -- ON CONFLICT
+    # cannot touch the same row twice within a single statement
+    rows = {}
     for job_data in jobs_data:
-        existing_job = Job.query.filter_by(hn_id=job_data['hn_id']).first()
-        
-        if existing_job:
-            # Update existing job
-            existing_job.title = job_data['title']
-            existing_job.url = job_data['url']
-            existing_job.company = job_data.get('company')
-            existing_job.location = job_data.get('location')
-            existing_job.posted_date = job_data.get('posted_date')
-            existing_job.is_new = False
-        else:
-            # Create new job
-            new_job = Job(
-                hn_id=job_data['hn_id'],
-                title=job_data['title'],
-                url=job_data['url'],
-                company=job_data.get('company'),
-                location=job_data.get('location'),
-                posted_date=job_data.get('posted_date'),
-                is_new=True
-            )
-            db.session.add(new_job)
-            new_count += 1
-    
+        company = job_data.get('company')
+        location = job_data.get('location')
+        rows.setdefault(job_data['hn_id'], {
+            'hn_id': job_data['hn_id'],
+            'title': job_data['title'],
+            'url': job_data['url'],
+            'company': company,
+            'location': location,
+            'title_lc': job_data['title'].lower(),
+            'company_lc': company.lower() if company else None,
+            'location_lc': location.lower() if location else None,
+            'posted_date': job_data.get('posted_date'),
+        })
+    rows = list(rows.values())
+
+    # One round-trip to learn which ids already exist (for the new count),
+    # then one bulk upsert -- instead of a SELECT plus write per job
+    ids = [row['hn_id'] for row in rows]
+    existing = _existing_hn_ids(ids)
+
+    new_count = 0
+    for row in rows:
+        row['is_new'] = row['hn_id'] not in existing
+        new_count += row['is_new']
+
+    insert = postgresql.insert if db.engine.name == 'postgresql' else sqlite.insert
+    stmt = insert(Job.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['hn_id'],
+        set_={
+            'title': stmt.excluded.title,
+            'url': stmt.excluded.url,
+            'company': stmt.excluded.company,
+            'location': stmt.excluded.location,
+            'title_lc': stmt.excluded.title_lc,
+            'company_lc': stmt.excluded.company_lc,
+            'location_lc': stmt.excluded.location_lc,
+            'posted_date': stmt.excluded.posted_date,
+            'is_new': False,
+        }
+    )
+    db.session.execute(stmt)
     db.session.commit()
+
+    # New rows make the memoized stats stale
+    _stats_cache['payload'] = None
+
+    # Rebuild the pre-serialized /jobs responses against the fresh data
+    _precompute_jobs_responses()
+
     logger.info(f"Saved {new_count} new jobs to database")
     return new_count
 
@@ -289,12 +649,81 @@ def background_scrape():
     """Background job to scrape and save jobs periodically"""
     with app.app_context():
         try:
+            # With a shared Redis cache, make sure only one gunicorn worker
+            # runs the scrape per interval
+            if redis_client:
+                if not redis_client.set('hn:scrape:lock', os.getpid(), nx=True, ex=300):
+                    logger.info("Another worker holds the scrape lock, skipping")
+                    return
+
             logger.info("Running background scrape job")
-            jobs = scrape_jobs(use_cache=False)
+            # Fetch all configured pages concurrently so the scheduler
+            # thread blocks for ~1 RTT instead of one RTT per page
+            num_pages = int(os.environ.get('SCRAPE_PAGES', 1))
+            jobs = scrape_pages(range(1, num_pages + 1))
             save_jobs_to_db(jobs)
         except Exception as e:
             logger.error(f"Background scrape failed: {e}")
 
+# Pre-serialized default /jobs payloads, rebuilt after every scrape
+# commit: the hottest request shapes collapse to a cache read plus a
+# socket write, with no query or marshalling at request time
+_PRESERIALIZED_TTL = 3600
+_preserialized = {}
+
+def _jobs_payload(new_only=False, limit=30):
+    """Build the default /jobs response payload (first keyset page)"""
+    query = Job.query
+    if new_only:
+        query = query.filter_by(is_new=True)
+    query = query.order_by(Job.scraped_at.desc(), Job.id.desc())
+
+    rows = query.limit(limit + 1).all()
+    jobs = rows[:limit]
+    next_cursor = encode_cursor(jobs[-1]) if len(rows) > limit else None
+
+    return {
+        'jobs': marshal(jobs, job_model),
+        'pagination': {
+            'limit': limit,
+            'next_cursor': next_cursor
+        }
+    }
+
+def _precompute_jobs_responses():
+    """Serialize the most common /jobs responses once per scrape commit"""
+    for new_only in (False, True):
+        try:
+            blob = orjson.dumps(_jobs_payload(new_only=new_only), option=orjson.OPT_NAIVE_UTC)
+        except Exception as e:
+            logger.warning(f"Pre-serializing /jobs responses failed: {e}")
+            return
+
+        key = f'resp:jobs:new{int(new_only)}'
+        if redis_client:
+            try:
+                redis_client.set(key, blob, ex=_PRESERIALIZED_TTL)
+                continue
+            except Exception as e:
+                logger.warning(f"Redis write failed for {key}: {e}")
+        _preserialized[key] = {'blob': blob, 'timestamp': time.monotonic()}
+
+def _preserialized_response(new_only=False):
+    """Return a raw Response for a pre-serialized /jobs payload, if any"""
+    key = f'resp:jobs:new{int(new_only)}'
+    if redis_client:
+        try:
+            blob = redis_client.get(key)
+            if blob:
+                return Response(blob, mimetype='application/json')
+        except Exception as e:
+            logger.warning(f"Redis read failed for {key}: {e}")
+        return None
+    entry = _preserialized.get(key)
+    if entry and time.monotonic() - entry['timestamp'] < _PRESERIALIZED_TTL:
+        return Response(entry['blob'], mimetype='application/json')
+    return None
+
 # API Routes
 @api.route('/')
 class Home(Resource):
@@ -311,7 +740,7 @@ class Home(Resource):
                 "stats": "/stats - API statistics"
             },
             "documentation": "/docs"
-        }
+        }, 200, {'Cache-Control': 'public, max-age=3600'}
 
 @api.route('/health')
 class Health(Resource):
@@ -328,39 +757,49 @@ class Health(Resource):
             "status": "healthy",
             "database": db_status,
             "timestamp": datetime.utcnow().isoformat(),
-            "cache_age_seconds": (datetime.utcnow() - cache['timestamp']).total_seconds() if cache['timestamp'] else None
+            "cache_age_seconds": cache_age_seconds()
         }
 
 @api.route('/stats')
 class Stats(Resource):
     def get(self):
         """Get API statistics"""
+        # Serve the memoized payload while it is fresh; save_jobs_to_db
+        # invalidates it whenever new data lands
+        if _stats_cache['payload'] is not None:
+            if time.monotonic() - _stats_cache['timestamp'] < _STATS_CACHE_TTL:
+                return _stats_cache['payload']
+
         total_jobs = Job.query.count()
         new_jobs = Job.query.filter_by(is_new=True).count()
         oldest_job = Job.query.order_by(Job.scraped_at.asc()).first()
         newest_job = Job.query.order_by(Job.scraped_at.desc()).first()
-        
-        return {
+
+        payload = {
             "total_jobs": total_jobs,
             "new_jobs": new_jobs,
             "oldest_job_date": oldest_job.scraped_at.isoformat() if oldest_job else None,
             "newest_job_date": newest_job.scraped_at.isoformat() if newest_job else None,
-            "cache_enabled": cache['timestamp'] is not None,
-            "cache_age_seconds": (datetime.utcnow() - cache['timestamp']).total_seconds() if cache['timestamp'] else None
+            "cache_enabled": cache['timestamp_monotonic'] is not None,
+            "cache_age_seconds": cache_age_seconds()
         }
+        _stats_cache['payload'] = payload
+        _stats_cache['timestamp'] = time.monotonic()
+        return payload
 
 @api.route('/jobs')
 class Jobs(Resource):
     @api.doc(params={
-        'page': 'Page number (default: 1)',
+        'page': 'Page number for scraped results (default: 1)',
         'limit': 'Number of results per page (default: 30)',
+        'cursor': 'Keyset cursor from a previous response (database results)',
+        'with_total': 'Include the total row count (true/false, default: false)',
         'search': 'Search query to filter jobs',
         'company': 'Filter by company name',
         'location': 'Filter by location',
         'new_only': 'Return only new jobs (true/false)',
         'use_cache': 'Use cached results (true/false, default: true)'
     })
-    @api.marshal_list_with(job_model)
     @limiter.limit("30 per minute")
     def get(self):
         """Get all jobs with optional filtering and pagination"""
@@ -368,46 +807,84 @@ class Jobs(Resource):
             # Get query parameters
             page = int(request.args.get('page', 1))
             limit = min(int(request.args.get('limit', 30)), 100)  # Max 100 per page
+            cursor = request.args.get('cursor')
+            with_total = request.args.get('with_total', 'false').lower() == 'true'
             search = request.args.get('search', '').lower()
             company = request.args.get('company', '').lower()
             location = request.args.get('location', '').lower()
             new_only = request.args.get('new_only', 'false').lower() == 'true'
             use_cache = request.args.get('use_cache', 'true').lower() == 'true'
-            
+
             # Check if we should scrape fresh data or use database
             use_db = request.args.get('use_db', 'true').lower() == 'true'
-            
+
+            # Default request shapes are pre-serialized at write time;
+            # short-circuit straight to the stored blob when one matches
+            if (use_db and page == 1 and limit == 30 and not cursor and not with_total
+                    and not search and not company and not location):
+                response = _preserialized_response(new_only)
+                if response is not None:
+                    return response
+
             if use_db:
                 # Query from database
                 query = Job.query
-                
+
                 if new_only:
                     query = query.filter_by(is_new=True)
-                
+
                 if search:
-                    query = query.filter(Job.title.ilike(f'%{search}%'))
-                
+                    query = query.filter(Job.title_lc.like(f'%{search}%'))
+
                 if company:
-                    query = query.filter(Job.company.ilike(f'%{company}%'))
-                
+                    query = query.filter(Job.company_lc.like(f'%{company}%'))
+
                 if location:
-                    query = query.filter(Job.location.ilike(f'%{location}%'))
-                
-                # Order by newest first
-                query = query.order_by(Job.scraped_at.desc())
-                
-                # Pagination
-                total = query.count()
-                jobs = query.offset((page - 1) * limit).limit(limit).all()
-                
+                    query = query.filter(Job.location_lc.like(f'%{location}%'))
+
+                # Keyset pagination on (scraped_at, id), newest first: no
+                # COUNT(*) and no O(offset) scan per request
+                query = query.order_by(Job.scraped_at.desc(), Job.id.desc())
+
+                # Snapshot before the cursor predicate: the total must
+                # cover the whole filtered set, not the rows past the cursor
+                count_query = query
+
+                if cursor:
+                    try:
+                        # binascii.Error is a ValueError subclass
+                        last_scraped_at, last_id = decode_cursor(cursor)
+                    except ValueError:
+                        api.abort(400, "Invalid cursor")
+                    query = query.filter(
+                        db.tuple_(Job.scraped_at, Job.id) < (last_scraped_at, last_id)
+                    )
+
+                # Fetch one extra row to know whether another page exists
+                rows = query.limit(limit + 1).all()
+                jobs = rows[:limit]
+                next_cursor = encode_cursor(jobs[-1]) if len(rows) > limit else None
+
+                pagination = {
+                    'limit': limit,
+                    'next_cursor': next_cursor
+                }
+
+                # The exact count is a full scan, so it is opt-in; for the
+                # unfiltered table on Postgres the planner's estimate is enough
+                if with_total:
+                    if db.engine.name == 'postgresql' and not (new_only or search or company or location):
+                        pagination['total'] = db.session.execute(db.text(
+                            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'jobs'"
+                        )).scalar() or 0
+                    else:
+                        pagination['total'] = count_query.count()
+
+                # Marshal the row objects directly; no intermediate
+                # dict pass over each record
                 return {
-                    'jobs': [job.to_dict() for job in jobs],
-                    'pagination': {
-                        'page': page,
-                        'limit': limit,
-                        'total': total,
-                        'pages': (total + limit - 1) // limit
-                    }
+                    'jobs': marshal(jobs, job_model),
+                    'pagination': pagination
                 }
             else:
                 # Scrape fresh data
@@ -437,6 +914,8 @@ class Jobs(Resource):
                     }
                 }
                 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error in /jobs: {e}")
             api.abort(500, f"Internal server error: {str(e)}")
@@ -448,8 +927,7 @@ class NewJobs(Resource):
     def get(self):
         """Get only new jobs that haven't been seen before"""
         try:
-            jobs = Job.query.filter_by(is_new=True).order_by(Job.scraped_at.desc()).all()
-            return [job.to_dict() for job in jobs]
+            return Job.query.filter_by(is_new=True).order_by(Job.scraped_at.desc()).all()
         except Exception as e:
             logger.error(f"Error in /jobs/new: {e}")
             api.abort(500, f"Internal server error: {str(e)}")
@@ -466,15 +944,13 @@ class SearchJobs(Resource):
             if not query:
                 api.abort(400, "Search query parameter 'q' is required")
             
-            jobs = Job.query.filter(
+            return Job.query.filter(
                 db.or_(
-                    Job.title.ilike(f'%{query}%'),
-                    Job.company.ilike(f'%{query}%'),
-                    Job.location.ilike(f'%{query}%')
+                    Job.title_lc.like(f'%{query}%'),
+                    Job.company_lc.like(f'%{query}%'),
+                    Job.location_lc.like(f'%{query}%')
                 )
             ).order_by(Job.scraped_at.desc()).limit(50).all()
-            
-            return [job.to_dict() for job in jobs]
         except Exception as e:
             logger.error(f"Error in /jobs/search: {e}")
             api.abort(500, f"Internal server error: {str(e)}")
@@ -502,6 +978,48 @@ def init_db():
     with app.app_context():
         try:
             db.create_all()
+
+            # create_all does not alter existing tables, so add the
+            # materialized lowercase columns to older databases here
+            lc_columns = (('title_lc', 500), ('company_lc', 200), ('location_lc', 200))
+            if db.engine.name == 'postgresql':
+                for column, length in lc_columns:
+                    db.session.execute(db.text(
+                        f'ALTER TABLE jobs ADD COLUMN IF NOT EXISTS {column} VARCHAR({length})'
+                    ))
+            else:
+                existing_columns = {row[1] for row in db.session.execute(db.text('PRAGMA table_info(jobs)'))}
+                for column, length in lc_columns:
+                    if column not in existing_columns:
+                        db.session.execute(db.text(
+                            f'ALTER TABLE jobs ADD COLUMN {column} VARCHAR({length})'
+                        ))
+
+            # Backfill rows saved before the lowercase columns existed:
+            # jobs already off the HN page are never re-upserted and
+            # would otherwise stay unsearchable
+            db.session.execute(db.text(
+                'UPDATE jobs SET title_lc = LOWER(title), company_lc = LOWER(company), '
+                'location_lc = LOWER(location) WHERE title_lc IS NULL'
+            ))
+
+            # create_all also skips indexes on existing tables, so make
+            # sure the composite hot-path index materializes on upgrades
+            db.session.execute(db.text(
+                'CREATE INDEX IF NOT EXISTS ix_jobs_is_new_scraped_at ON jobs (is_new, scraped_at)'
+            ))
+
+            # Trigram GIN indexes make the LIKE '%q%' filters index scans
+            # on Postgres; SQLite has no equivalent, so skip there
+            if db.engine.name == 'postgresql':
+                db.session.execute(db.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+                for column in ('title_lc', 'company_lc', 'location_lc'):
+                    db.session.execute(db.text(
+                        f'CREATE INDEX IF NOT EXISTS ix_jobs_{column}_trgm '
+                        f'ON jobs USING gin ({column} gin_trgm_ops)'
+                    ))
+            db.session.commit()
+
             logger.info("Database initialized - all tables created/verified")
         except Exception as e:
             logger.error(f"Database initialization error: {e}")
@@ -549,8 +1067,11 @@ def initialize_app():
         # Initialize database
         init_db()
         
-        # Setup scheduler if not already running
-        if scheduler is None or (hasattr(scheduler, 'running') and not scheduler.running):
+        # Setup scheduler if not already running; skip entirely when the
+        # standalone scheduler worker (scheduler.py) owns the scraping
+        if os.environ.get('DISABLE_INTERNAL_SCHEDULER'):
+            logger.info("Internal scheduler disabled, expecting external scheduler worker")
+        elif scheduler is None or (hasattr(scheduler, 'running') and not scheduler.running):
             scheduler = setup_scheduler()
             
             # Schedule initial scrape after a short delay (non-blocking)
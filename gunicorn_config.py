@@ -11,10 +11,15 @@ bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
 backlog = 2048
 
 # Worker processes
-# For free tier, use 1 worker to avoid scheduler conflicts
-# For paid tier, you can increase workers
-workers = int(os.environ.get('GUNICORN_WORKERS', 1))
-worker_class = 'sync'
+# gthread overlaps the IO-bound scrape/DB calls so one slow request no
+# longer blocks the whole worker. The embedded APScheduler starts in
+# every worker, so stay at 1 worker until scraping runs out-of-process
+# (scheduler.py + DISABLE_INTERNAL_SCHEDULER) -- concurrent scrapers
+# clobber each other's is_new flags
+default_workers = 2 if os.environ.get('DISABLE_INTERNAL_SCHEDULER') else 1
+workers = int(os.environ.get('GUNICORN_WORKERS', default_workers))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
 worker_connections = 1000
 timeout = 30
 keepalive = 2
@@ -0,0 +1,45 @@
+"""
+Standalone scraper scheduler.
+
+Run this as a separate worker process (python scheduler.py) with
+DISABLE_INTERNAL_SCHEDULER=1 set on the web service, so gunicorn web
+workers can scale out without each one carrying scheduler threads.
+"""
+import logging
+import os
+
+# Importing app runs initialize_app(), which starts the embedded
+# BackgroundScheduler unless this is set -- make the worker safe even
+# when the environment (e.g. a bare Procfile) doesn't set it
+os.environ.setdefault('DISABLE_INTERNAL_SCHEDULER', '1')
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app import app, background_scrape, init_db, run_initial_scrape
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run the scrape loop in the foreground"""
+    init_db()
+    # save_jobs_to_db needs an app context, like background_scrape sets up
+    with app.app_context():
+        run_initial_scrape()
+
+    scrape_interval = int(os.environ.get('SCRAPE_INTERVAL', 30))
+    scheduler = BlockingScheduler()
+    scheduler.add_job(
+        func=background_scrape,
+        trigger=IntervalTrigger(minutes=scrape_interval),
+        id='scrape_jobs',
+        name='Scrape Hacker News Jobs',
+        max_instances=1  # Prevent overlapping jobs
+    )
+    logger.info(f"Scheduler worker started (interval: {scrape_interval} minutes)")
+    scheduler.start()
+
+
+if __name__ == "__main__":
+    main()